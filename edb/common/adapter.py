@@ -30,6 +30,15 @@ class AdapterError(Exception):
 
 
 _adapters: Dict[Any, Dict[type, Adapter]] = {}
+# Registered adaptees and their adapters for every adapter metaclass,
+# stored as two parallel tuples.  Rebuilt on registration, so that the
+# lookup loop does not have to materialize dict items for every base
+# in the MRO.
+_adapter_table: Dict[
+    Any, Tuple[Tuple[type, ...], Tuple[Adapter, ...]]] = {}
+# Resolved adapters keyed by (adapter metaclass, adaptee class).
+# Any registration invalidates the whole cache.
+_adapter_cache: Dict[Tuple[Any, type], Optional[Adapter]] = {}
 
 
 class Adapter(type):
@@ -62,6 +71,9 @@ class Adapter(type):
 
             assert adapts not in adapters
             adapters[adapts] = result
+            _adapter_table[mcls] = (
+                tuple(adapters.keys()), tuple(adapters.values()))
+            _adapter_cache.clear()
 
         return result
 
@@ -96,15 +108,28 @@ class Adapter(type):
         mcls,
         reversed_mro: Tuple[type, ...],
     ) -> Optional[Adapter]:
-        adapters = _adapters.get(mcls)
-        if adapters is None:
+        table = _adapter_table.get(mcls)
+        if table is None:
             return None
 
+        # Every base in the MRO can only be a subclass of classes that
+        # are themselves in the MRO, so narrow the registry down to
+        # entries that can possibly match before testing each base.
+        mro_set = set(reversed_mro)
+        candidates = [
+            (adaptee, adapter)
+            for adaptee, adapter in zip(*table)
+            if adaptee in mro_set or adapter in mro_set
+        ]
+        if not candidates:
+            return None
+
+        match_adapter = mcls._match_adapter
         result = None
         seen: Set[Adapter] = set()
         for base in reversed_mro:
-            for adaptee, adapter in adapters.items():
-                found = mcls._match_adapter(base, adaptee, adapter)
+            for adaptee, adapter in candidates:
+                found = match_adapter(base, adaptee, adapter)
 
                 if found and found not in seen:
                     result = found
@@ -114,6 +139,18 @@ class Adapter(type):
 
     @classmethod
     def get_adapter(mcls, obj: Any) -> Optional[Adapter]:
+        key = (mcls, obj)
+        try:
+            return _adapter_cache[key]
+        except KeyError:
+            pass
+
+        result = mcls._lookup_adapter(obj)
+        _adapter_cache[key] = result
+        return result
+
+    @classmethod
+    def _lookup_adapter(mcls, obj: Any) -> Optional[Adapter]:
         mro = obj.__mro__
 
         reversed_mro = tuple(reversed(mro))
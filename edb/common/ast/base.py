@@ -127,10 +127,19 @@ class AST:
         globalns = sys.modules[cls.__module__].__dict__.copy()
         globalns[cls.__name__] = cls
 
+        # Resolve only the annotations declared directly on this class:
+        # get_type_hints() on the class itself would also re-evaluate
+        # the annotations of every class in its MRO.
+        own_annos = type(cls.__name__, (), {
+            '__module__': cls.__module__,
+            '__annotations__': dct['__annotations__'],
+        })
+        localns = dict(dct)
+
         try:
             while True:
                 try:
-                    annos = get_type_hints(cls, globalns)
+                    annos = get_type_hints(own_annos, globalns, localns)
                 except NameError as e:
                     # Forward type declaration.  Generally, we try
                     # to avoid these as much as possible, but when
@@ -153,8 +162,12 @@ class AST:
                 f'{cls.__module__}.{cls.__qualname__}')
 
         if annos:
-            annos = {k: v for k, v in annos.items()
-                     if k in dct['__annotations__']}
+            # Keep the field order get_type_hints() on the class would
+            # produce, where redeclared fields retain their base position.
+            order = dict.fromkeys(
+                k for base in reversed(cls.__mro__)
+                for k in base.__dict__.get('__annotations__', ()))
+            annos = {k: annos[k] for k in order if k in annos}
 
             hidden = ()
             if '__ast_hidden__' in dct:
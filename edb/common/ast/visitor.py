@@ -34,18 +34,21 @@ def find_children(node, test_func, *args,
                   terminate_early=False, **kwargs):
     visited = set()
     result = []
+    # Walk the tree in pre-order with an explicit stack rather than
+    # recursing into every field value.
+    stack = [node]
+
+    while stack:
+        node = stack.pop()
 
-    def _find_children(node):
         if isinstance(node, (tuple, list, set, frozenset)):
-            for n in node:
-                if _find_children(n):
-                    return True
-            return False
+            stack.extend(reversed(tuple(node)))
+            continue
         elif not base.is_ast_node(node):
-            return False
+            continue
 
         if node in visited:
-            return False
+            continue
         else:
             visited.add(node)
 
@@ -53,21 +56,20 @@ def find_children(node, test_func, *args,
             if test_func(node, *args, **kwargs):
                 result.append(node)
                 if terminate_early:
-                    return True
+                    break
         except SkipNode:
-            return False
+            continue
 
-        for field, value in base.iter_fields(node, include_meta=False):
-            field_spec = node._fields[field]
-            if field_spec.hidden:
+        children = []
+        for field_name, field_spec in node._fields.items():
+            if field_spec.meta or field_spec.hidden:
                 continue
+            value = getattr(node, field_name, None)
+            if value is not None:
+                children.append(value)
 
-            if _find_children(value):
-                return True
-
-        return False
+        stack.extend(reversed(children))
 
-    _find_children(node)
     if terminate_early:
         if result:
             return result[0]
@@ -25,6 +25,8 @@ import collections
 import re
 
 
+_alias_suffix_re = re.compile(r'~\d+$')
+
 ContextLevel_T = TypeVar('ContextLevel_T', bound='ContextLevel')
 
 
@@ -130,9 +132,10 @@ class AliasGenerator(SimpleCounter):
     def get(self, hint: str = '') -> str:
         if not hint:
             hint = 'v'
-        m = re.search(r'~\d+$', hint)
-        if m:
-            hint = hint[:m.start()]
+        if '~' in hint:
+            m = _alias_suffix_re.search(hint)
+            if m:
+                hint = hint[:m.start()]
 
         idx = self.nextval(hint)
         alias = f'{hint}~{idx}'
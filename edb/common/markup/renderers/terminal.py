@@ -198,47 +198,46 @@ class Buffer:
         return ''.join(result)
 
 
+# (renderer class, markup class) -> unbound render method.  Renderers
+# are instantiated per renders() call, so the lookup is kept here
+# rather than on the instance.
+_renderers_cache = {}
+
+
 class BaseRenderer:
     def __init__(self, *, indent_with=' ' * 4, max_width=None, styles=None):
-        self.renderers_cache = {}
         self.buffer = Buffer(
             max_width=max_width, styled=styles, indent_with=indent_with)
         self.max_width = max_width
         self.styles = styles or styles_module.StylesTable()
 
+    @classmethod
+    def _find_renderer(cls, markup_cls):
+        for base in markup_cls.__mro__:
+            if issubclass(base, elements.base.Markup):
+                renderer = getattr(
+                    cls, f'_render_{base._markup_name_safe}', None)
+                if renderer is not None:
+                    return renderer
+
+        return None
+
     def _render(self, markup):
         cls = markup.__class__
-        renderer = None
 
         if not issubclass(cls, elements.base.Markup):
             return self._render_unknown(markup)
 
+        key = (type(self), cls)
         try:
-            renderer = self.renderers_cache[cls]
+            renderer = _renderers_cache[key]
         except KeyError:
-            cls_name = markup.__class__._markup_name_safe
-
-            try:
-                renderer = getattr(self, '_render_{}'.format(cls_name))
-            except AttributeError:
-                for base in markup.__class__.__mro__:
-                    if issubclass(base, elements.base.Markup):
-                        try:
-                            renderer = getattr(
-                                self,
-                                '_render_{}'.format(base._markup_name_safe))
-                        except AttributeError:
-                            pass
-                        else:
-                            self.renderers_cache[cls] = renderer
-                            break
-            else:
-                self.renderers_cache[cls] = renderer
+            renderer = _renderers_cache[key] = self._find_renderer(cls)
 
         if renderer is None:
             raise Exception('no renderer found for {!r}'.format(markup))
 
-        return renderer(markup)
+        return renderer(self, markup)
 
     def _render_header(self, str, level=1):
         # TODO: Rendering should be moved to Buffer (as only there we're aware
@@ -33,7 +33,7 @@ class OrderedSet(MutableSet[K]):
 
     def __init__(self, iterable: Optional[Iterable[K]] = None) -> None:
         if iterable is not None:
-            self.map = {v: None for v in iterable}
+            self.map = dict.fromkeys(iterable)
         else:
             self.map = {}
 
@@ -44,8 +44,7 @@ class OrderedSet(MutableSet[K]):
         self.map.pop(item, None)
 
     def update(self, iterable: Iterable[K]) -> None:
-        for item in iterable:
-            self.map[item] = None
+        self.map.update(dict.fromkeys(iterable))
 
     def replace(self, existing: K, new: K) -> None:
         if existing not in self.map:
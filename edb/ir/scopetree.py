@@ -30,6 +30,7 @@ import weakref
 
 from edb import errors
 from edb.common import context as pctx
+from edb.common import ordered
 from edb.common import term
 from . import pathid
 
@@ -74,7 +75,7 @@ class ScopeTreeNode:
     optional: bool
     """Whether this node represents an optional path."""
 
-    children: List[ScopeTreeNode]
+    children: ordered.OrderedSet[ScopeTreeNode]
     """A set of child nodes."""
 
     namespaces: Set[pathid.Namespace]
@@ -101,7 +102,7 @@ class ScopeTreeNode:
         self.factoring_fence = False
         self.factoring_allowlist = set()
         self.optional = optional
-        self.children = []
+        self.children = ordered.OrderedSet()
         self.namespaces = set()
         self.is_group = False
         self._parent: Optional[weakref.ReferenceType[ScopeTreeNode]] = None
@@ -998,7 +999,7 @@ class ScopeTreeNode:
 
         if parent is not None:
             self._parent = weakref.ref(parent)
-            parent.children.append(self)
+            parent.children.add(self)
         else:
             self._parent = None
 
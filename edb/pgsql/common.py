@@ -43,9 +43,15 @@ from edb.schema import schema as s_schema
 from . import keywords as pg_keywords
 
 
+_e_literal_split_re = re.compile(r"(\n|\\\\|\\')")
+_objtype_trigger_aspect_re = re.compile(
+    r'(source|target)-del-(def|imm)-(inl|otl)-(f|t)')
+_has_letters_re = re.compile(r'[a-zA-Z]')
+
+
 def quote_e_literal(string):
     def escape_sq(s):
-        split = re.split(r"(\n|\\\\|\\')", s)
+        split = _e_literal_split_re.split(s)
 
         if len(split) == 1:
             return s.replace(r"'", r"\'")
@@ -78,6 +84,7 @@ def quote_bytea_literal(data: bytes) -> str:
         return "''::bytea"
 
 
+@functools.lru_cache(maxsize=10240)
 def needs_quoting(string):
     isalnum = (string and not string[0].isdecimal() and
                string.replace('_', 'a').isalnum())
@@ -132,7 +139,7 @@ def get_unique_random_name() -> str:
     return base64.b64encode(uuidgen.uuid1mc().bytes).rstrip(b'=').decode()
 
 
-@functools.lru_cache()
+@functools.lru_cache(maxsize=10240)
 def _edgedb_name_to_pg_name(name: str, prefix_length: int = 0) -> str:
     # Note: PostgreSQL doesn't have a sha1 implementation as a
     # built-in function available in all versions, hence we use md5.
@@ -172,11 +179,16 @@ def edgedb_name_to_pg_name(name: str, prefix_length: int = 0) -> str:
 
 
 def convert_name(name, suffix='', catenate=True):
-    schema = get_module_backend_name(name.get_module_name())
+    return _convert_name(name.get_module_name(), name.name, suffix, catenate)
+
+
+@functools.lru_cache(maxsize=10240)
+def _convert_name(module, name, suffix='', catenate=True):
+    schema = get_module_backend_name(module)
     if suffix:
-        sname = f'{name.name}_{suffix}'
+        sname = f'{name}_{suffix}'
     else:
-        sname = name.name
+        sname = name
 
     dbname = edgedb_name_to_pg_name(sname)
 
@@ -206,6 +218,7 @@ def update_aspect(name, aspect):
         return (name[0], stripped)
 
 
+@functools.lru_cache(maxsize=10240)
 def get_scalar_backend_name(id, module_name, catenate=True, *, aspect=None):
     if aspect is None:
         aspect = 'domain'
@@ -215,33 +228,35 @@ def get_scalar_backend_name(id, module_name, catenate=True, *, aspect=None):
     ):
         raise ValueError(
             f'unexpected aspect for scalar backend name: {aspect!r}')
-    name = s_name.QualName(module=module_name, name=str(id))
-    return convert_name(name, aspect, catenate)
+    return _convert_name(
+        s_name.UnqualName(module_name), str(id), aspect, catenate)
+
+
+_aspect_suffixes = {
+    'table': '',
+    'inhview': 't',
+}
 
 
 def get_aspect_suffix(aspect):
-    if aspect == 'table':
-        return ''
-    elif aspect == 'inhview':
-        return 't'
-    else:
-        return aspect
+    return _aspect_suffixes.get(aspect, aspect)
 
 
+@functools.lru_cache(maxsize=10240)
 def get_objtype_backend_name(id, module_name, *, catenate=True, aspect=None):
     if aspect is None:
         aspect = 'table'
-    if aspect not in {'table', 'inhview'} and not re.match(
-            r'(source|target)-del-(def|imm)-(inl|otl)-(f|t)', aspect):
+    if (aspect not in {'table', 'inhview'}
+            and not _objtype_trigger_aspect_re.match(aspect)):
         raise ValueError(
             f'unexpected aspect for object type backend name: {aspect!r}')
 
-    name = s_name.QualName(module=module_name, name=str(id))
-
     suffix = get_aspect_suffix(aspect)
-    return convert_name(name, suffix=suffix, catenate=catenate)
+    return _convert_name(
+        s_name.UnqualName(module_name), str(id), suffix, catenate)
 
 
+@functools.lru_cache(maxsize=10240)
 def get_pointer_backend_name(id, module_name, *, catenate=False, aspect=None):
     if aspect is None:
         aspect = 'table'
@@ -250,10 +265,9 @@ def get_pointer_backend_name(id, module_name, *, catenate=False, aspect=None):
         raise ValueError(
             f'unexpected aspect for pointer backend name: {aspect!r}')
 
-    name = s_name.QualName(module=module_name, name=str(id))
-
     suffix = get_aspect_suffix(aspect)
-    return convert_name(name, suffix=suffix, catenate=catenate)
+    return _convert_name(
+        s_name.UnqualName(module_name), str(id), suffix, catenate)
 
 
 _operator_map = {
@@ -269,6 +283,7 @@ _operator_map = {
 }
 
 
+@functools.lru_cache(maxsize=10240)
 def get_operator_backend_name(name, catenate=False, *, aspect=None):
     if aspect is None:
         aspect = 'operator'
@@ -282,7 +297,7 @@ def get_operator_backend_name(name, catenate=False, *, aspect=None):
     oper_name = _operator_map.get(name)
     if oper_name is None:
         oper_name = name.name
-        if re.search(r'[a-zA-Z]', oper_name):
+        if _has_letters_re.search(oper_name):
             # Alphanumeric operator, cannot be expressed in Postgres as-is
             # Since this is a rare occasion, we hard-code the translation
             # table.
@@ -330,8 +345,8 @@ def get_constraint_backend_name(
         raise ValueError(
             f'unexpected aspect for constraint backend name: {aspect!r}')
 
-    name = s_name.QualName(module=module_name, name=str(id))
-    return convert_name(name, aspect, catenate)
+    return _convert_name(
+        s_name.UnqualName(module_name), str(id), aspect, catenate)
 
 
 def get_constraint_raw_name(id):
@@ -341,63 +356,111 @@ def get_constraint_raw_name(id):
 def get_index_backend_name(id, module_name, catenate=True, *, aspect=None):
     if aspect is None:
         aspect = 'index'
-    name = s_name.QualName(module=module_name, name=str(id))
-    return convert_name(name, aspect, catenate)
+    return _convert_name(
+        s_name.UnqualName(module_name), str(id), aspect, catenate)
+
+
+_edgedb_module = s_name.UnqualName('edgedb')
 
 
 def get_tuple_backend_name(id, catenate=True, *, aspect=None):
 
-    name = s_name.QualName(module='edgedb', name=f'{id}_t')
-    return convert_name(name, aspect, catenate)
+    return _convert_name(_edgedb_module, f'{id}_t', aspect, catenate)
 
 
-def get_backend_name(schema, obj, catenate=True, *, aspect=None):
-    if isinstance(obj, s_objtypes.ObjectType):
-        name = obj.get_name(schema)
-        return get_objtype_backend_name(
-            obj.id, name.module, catenate=catenate, aspect=aspect)
-
-    elif isinstance(obj, s_abc.Pointer):
-        name = obj.get_name(schema)
-        return get_pointer_backend_name(obj.id, name.module, catenate=catenate,
-                                        aspect=aspect)
-
-    elif isinstance(obj, s_scalars.ScalarType):
-        name = obj.get_name(schema)
-        return get_scalar_backend_name(obj.id, name.module, catenate=catenate,
-                                       aspect=aspect)
-
-    elif isinstance(obj, s_opers.Operator):
-        name = obj.get_shortname(schema)
-        return get_operator_backend_name(
-            name, catenate, aspect=aspect)
-
-    elif isinstance(obj, s_casts.Cast):
-        name = obj.get_name(schema)
-        return get_cast_backend_name(
-            name, catenate, aspect=aspect)
-
-    elif isinstance(obj, s_func.Function):
-        name = obj.get_shortname(schema)
-        backend_name = obj.get_backend_name(schema)
-        return get_function_backend_name(
-            name, backend_name, catenate)
-
-    elif isinstance(obj, s_mod.Module):
-        name = obj.get_name(schema)
-        return get_module_backend_name(name.get_module_name())
-
-    elif isinstance(obj, s_constr.Constraint):
-        name = obj.get_name(schema)
-        return get_constraint_backend_name(
-            obj.id, name.module, catenate, aspect=aspect)
-
-    elif isinstance(obj, s_types.Tuple):
-        return get_tuple_backend_name(
-            obj.id, catenate, aspect=aspect)
+def _objtype_backend_name(schema, obj, catenate, aspect):
+    name = obj.get_name(schema)
+    return get_objtype_backend_name(
+        obj.id, name.module, catenate=catenate, aspect=aspect)
+
+
+def _pointer_backend_name(schema, obj, catenate, aspect):
+    name = obj.get_name(schema)
+    return get_pointer_backend_name(obj.id, name.module, catenate=catenate,
+                                    aspect=aspect)
+
+
+def _scalar_backend_name(schema, obj, catenate, aspect):
+    name = obj.get_name(schema)
+    return get_scalar_backend_name(obj.id, name.module, catenate=catenate,
+                                   aspect=aspect)
+
+
+def _operator_backend_name(schema, obj, catenate, aspect):
+    name = obj.get_shortname(schema)
+    return get_operator_backend_name(
+        name, catenate, aspect=aspect)
+
 
+def _cast_backend_name(schema, obj, catenate, aspect):
+    name = obj.get_name(schema)
+    return get_cast_backend_name(
+        name, catenate, aspect=aspect)
+
+
+def _function_backend_name(schema, obj, catenate, aspect):
+    name = obj.get_shortname(schema)
+    backend_name = obj.get_backend_name(schema)
+    return get_function_backend_name(
+        name, backend_name, catenate)
+
+
+def _module_backend_name(schema, obj, catenate, aspect):
+    name = obj.get_name(schema)
+    return get_module_backend_name(name.get_module_name())
+
+
+def _constraint_backend_name(schema, obj, catenate, aspect):
+    name = obj.get_name(schema)
+    return get_constraint_backend_name(
+        obj.id, name.module, catenate, aspect=aspect)
+
+
+def _tuple_backend_name(schema, obj, catenate, aspect):
+    return get_tuple_backend_name(
+        obj.id, catenate, aspect=aspect)
+
+
+def _no_backend_name(schema, obj, catenate, aspect):
+    raise ValueError(f'cannot determine backend name for {obj!r}')
+
+
+# Checked in order, the first matching class wins.
+_backend_name_getters = (
+    (s_objtypes.ObjectType, _objtype_backend_name),
+    (s_abc.Pointer, _pointer_backend_name),
+    (s_scalars.ScalarType, _scalar_backend_name),
+    (s_opers.Operator, _operator_backend_name),
+    (s_casts.Cast, _cast_backend_name),
+    (s_func.Function, _function_backend_name),
+    (s_mod.Module, _module_backend_name),
+    (s_constr.Constraint, _constraint_backend_name),
+    (s_types.Tuple, _tuple_backend_name),
+)
+
+# Resolved getters keyed by the exact object class, populated lazily,
+# so that the isinstance() cascade above runs once per class.
+_backend_name_dispatch = {}
+
+
+def _resolve_backend_name_getter(cls):
+    for base, getter in _backend_name_getters:
+        if issubclass(cls, base):
+            break
     else:
-        raise ValueError(f'cannot determine backend name for {obj!r}')
+        getter = _no_backend_name
+
+    _backend_name_dispatch[cls] = getter
+    return getter
+
+
+def get_backend_name(schema, obj, catenate=True, *, aspect=None):
+    cls = type(obj)
+    try:
+        getter = _backend_name_dispatch[cls]
+    except KeyError:
+        getter = _resolve_backend_name_getter(cls)
+    return getter(schema, obj, catenate, aspect)
 
 
 def get_object_from_backend_name(schema, metaclass, name, *, aspect=None):
@@ -42,10 +42,27 @@ class NotSpecifiedT(enum.Enum):
 NotSpecified: Final = NotSpecifiedT.NotSpecified
 
 
+# Encoders for the most common plain values, keyed by exact type, so
+# that these do not have to go through the isinstance() cascade in
+# encode_value().  The results must match what the cascade produces.
+_simple_value_encoders: Dict[type, Callable[[Any], str]] = {
+    str: ql,
+    int: str,
+    float: str,
+    bool: lambda val: str(int(val)),
+    type(None): lambda val: 'NULL',
+}
+
+
 def encode_value(val: Any) -> str:
     """Encode value into an appropriate SQL expression."""
-    if hasattr(val, 'to_sql_expr'):
-        val = val.to_sql_expr()
+    encoder = _simple_value_encoders.get(type(val))
+    if encoder is not None:
+        return encoder(val)
+
+    to_sql_expr = getattr(val, 'to_sql_expr', None)
+    if to_sql_expr is not None:
+        val = to_sql_expr()
     elif isinstance(val, tuple):
         val_list = [encode_value(el) for el in val]
         val = f'ROW({", ".join(val_list)})'
@@ -428,6 +445,8 @@ class Default(metaclass=DefaultMeta):
 
 
 class DBObject:
+    __slots__ = ('metadata',)
+
     def __init__(self, *, metadata=None):
         self.metadata = metadata
 
@@ -92,16 +92,22 @@ class CompositeDBObject(base.DBObject):
         super().__init__()
         self.name = name
         self._columns = ordered.OrderedSet()
+        # The Record class is built lazily and is reset whenever
+        # the set of columns changes.
+        self._record = None
         self.add_columns(columns or [])
 
     def add_columns(self, iterable):
         self._columns.update(iterable)
+        self._record = None
 
     @property
     def record(self):
-        return Record(
-            self.__class__.__name__ + '_record',
-            [c.name for c in self._columns], default=base.Default)
+        if self._record is None:
+            self._record = Record(
+                self.__class__.__name__ + '_record',
+                [c.name for c in self._columns], default=base.Default)
+        return self._record
 
 
 class CompositeAttributeCommand:
@@ -60,6 +60,7 @@ class Table(composites.CompositeDBObject):
         self.bases.update(iterable)
         self.columns = \
             collections.OrderedDict((c.name, c) for c in self.iter_columns())
+        self._record = None
 
     def add_columns(self, iterable):
         super().add_columns(iterable)
@@ -80,9 +81,11 @@ class Table(composites.CompositeDBObject):
 
     @property
     def record(self):
-        return composites.Record(
-            self.__class__.__name__ + '_record',
-            list(self.columns), default=base.Default)
+        if self._record is None:
+            self._record = composites.Record(
+                self.__class__.__name__ + '_record',
+                list(self.columns), default=base.Default)
+        return self._record
 
     @property
     def system_catalog(self):
@@ -103,6 +106,9 @@ class InheritableTableObject(base.InheritableDBObject):
 
 
 class Column(base.DBObject):
+    # Tables and delta commands create a lot of these.
+    __slots__ = ('name', 'type', 'required', 'default', 'readonly', 'comment')
+
     def __init__(
             self, name, type, required=False, default=None, readonly=False,
             comment=None):
@@ -371,6 +377,7 @@ class AlterTable(
         self.ops = self.commands
 
     add_operation = base.CompositeCommandGroup.add_command
+    add_operations = base.CompositeCommandGroup.add_commands
 
 
 class AlterTableAddParent(AlterTableFragment):
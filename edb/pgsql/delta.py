@@ -23,6 +23,7 @@ from __future__ import annotations
 from typing import *
 
 import collections.abc
+import functools
 import itertools
 import textwrap
 
@@ -90,6 +91,11 @@ if TYPE_CHECKING:
     from edb.schema import schema as s_schema
 
 
+schemac_to_backendc = \
+    schemamech.ConstraintMech.schema_constraint_to_backend_constraint
+
+
+@functools.lru_cache()
 def has_table(obj, schema):
     if isinstance(obj, s_objtypes.ObjectType):
         return not (
@@ -133,9 +139,10 @@ class MetaCommand(sd.Command, metaclass=CommandMeta):
         context: sd.CommandContext,
     ) -> s_schema.Schema:
         schema = super().apply_prerequisites(schema, context)
-        for op in self.get_prerequisites():
-            if not isinstance(op, sd.AlterObjectProperty):
-                self.pgops.add(op)
+        self.pgops.update(
+            op for op in self.get_prerequisites()
+            if not isinstance(op, sd.AlterObjectProperty)
+        )
         return schema
 
     def apply_subcommands(
@@ -144,12 +151,13 @@ class MetaCommand(sd.Command, metaclass=CommandMeta):
         context: sd.CommandContext,
     ) -> s_schema.Schema:
         schema = super().apply_subcommands(schema, context)
-        for op in self.get_subcommands(
-            include_prerequisites=False,
-            include_caused=False,
-        ):
-            if not isinstance(op, sd.AlterObjectProperty):
-                self.pgops.add(op)
+        self.pgops.update(
+            op for op in self.get_subcommands(
+                include_prerequisites=False,
+                include_caused=False,
+            )
+            if not isinstance(op, sd.AlterObjectProperty)
+        )
         return schema
 
     def apply_caused(
@@ -158,9 +166,10 @@ class MetaCommand(sd.Command, metaclass=CommandMeta):
         context: sd.CommandContext,
     ) -> s_schema.Schema:
         schema = super().apply_caused(schema, context)
-        for op in self.get_caused():
-            if not isinstance(op, sd.AlterObjectProperty):
-                self.pgops.add(op)
+        self.pgops.update(
+            op for op in self.get_caused()
+            if not isinstance(op, sd.AlterObjectProperty)
+        )
         return schema
 
     def generate(self, block: dbops.PLBlock) -> None:
@@ -1937,9 +1946,6 @@ class ConstraintCommand(MetaCommand):
                 and not context.is_deleting(base)
             ):
                 subject = base.get_subject(schema)
-                schemac_to_backendc = \
-                    schemamech.ConstraintMech.\
-                    schema_constraint_to_backend_constraint
                 bconstr = schemac_to_backendc(
                     subject, base, schema, context, source_context)
                 op.add_command(bconstr.alter_ops(
@@ -1955,9 +1961,6 @@ class ConstraintCommand(MetaCommand):
             subject = constraint.get_subject(schema)
 
             if subject is not None:
-                schemac_to_backendc = \
-                    schemamech.ConstraintMech.\
-                    schema_constraint_to_backend_constraint
                 bconstr = schemac_to_backendc(
                     subject, constraint, schema, context,
                     source_context)
@@ -1974,9 +1977,6 @@ class ConstraintCommand(MetaCommand):
             subject = constraint.get_subject(schema)
 
             if subject is not None:
-                schemac_to_backendc = \
-                    schemamech.ConstraintMech.\
-                    schema_constraint_to_backend_constraint
                 bconstr = schemac_to_backendc(
                     subject, constraint, schema, context,
                     source_context)
@@ -1993,9 +1993,6 @@ class ConstraintCommand(MetaCommand):
             subject = constraint.get_subject(schema)
 
             if subject is not None:
-                schemac_to_backendc = \
-                    schemamech.ConstraintMech.\
-                    schema_constraint_to_backend_constraint
                 bconstr = schemac_to_backendc(
                     subject, constraint, schema, context,
                     source_context)
@@ -2077,10 +2074,6 @@ class AlterConstraint(
             return schema
 
         if subject is not None:
-            schemac_to_backendc = \
-                schemamech.ConstraintMech.\
-                schema_constraint_to_backend_constraint
-
             bconstr = schemac_to_backendc(
                 subject, constraint, schema, context, self.source_context)
 
@@ -2346,8 +2339,14 @@ class AlterScalarType(ScalarTypeMetaCommand, adapts=s_scalars.AlterScalarType):
         # composite_only.
         scls_type = s_types.Collection if composite_only else None
         wl = list(schema.get_referrers(typ, scls_type=scls_type))
+        # Objects may be reachable through several referrer chains,
+        # only expand each of them once.
+        visited = set()
         while wl:
             obj = wl.pop()
+            if obj in visited:
+                continue
+            visited.add(obj)
             if isinstance(obj, s_props.Property):
                 seen_props.add(obj)
             elif isinstance(obj, s_scalars.ScalarType) and not composite_only:
@@ -2692,33 +2691,30 @@ class CompositeMetaCommand(MetaCommand):
         super().__init__(**kwargs)
         self.table_name = None
         self._multicommands = {}
-        self.update_search_indexes = None
         self.inhview_updates = set()
         self.post_inhview_update_commands = []
 
     def _get_multicommand(
             self, context, cmdtype, object_name, *,
             force_new=False, manual=False, cmdkwargs=None):
-        if cmdkwargs is None:
+        # cmdkwargs is expected to be a handful of keyword arguments
+        # with hashable values, so a tuple of sorted items is a cheaper
+        # canonical key than a frozenset.
+        if cmdkwargs:
+            key = (object_name, tuple(sorted(cmdkwargs.items())))
+        else:
             cmdkwargs = {}
-        key = (object_name, frozenset(cmdkwargs.items()))
-
-        try:
-            typecommands = self._multicommands[cmdtype]
-        except KeyError:
-            typecommands = self._multicommands[cmdtype] = {}
+            key = (object_name, ())
 
+        typecommands = self._multicommands.setdefault(cmdtype, {})
         commands = typecommands.get(key)
 
         if commands is None or force_new or manual:
             command = cmdtype(object_name, **cmdkwargs)
 
             if not manual:
-                try:
-                    commands = typecommands[key]
-                except KeyError:
+                if commands is None:
                     commands = typecommands[key] = []
-
                 commands.append(command)
         else:
             command = commands[-1]
@@ -2726,17 +2722,11 @@ class CompositeMetaCommand(MetaCommand):
         return command
 
     def _attach_multicommand(self, context, cmdtype):
-        try:
-            typecommands = self._multicommands[cmdtype]
-        except KeyError:
-            return
-        else:
-            commands = list(
+        typecommands = self._multicommands.get(cmdtype)
+        if typecommands:
+            self.pgops.update(
                 itertools.chain.from_iterable(typecommands.values()))
 
-            if commands:
-                self.pgops.update(commands)
-
     def get_alter_table(
             self, schema, context, force_new=False,
             contained=False, manual=False, table_name=None):
@@ -2786,6 +2776,7 @@ class CompositeMetaCommand(MetaCommand):
     ) -> Optional[str]:
         if isinstance(obj, s_sources.Source):
             ptrs = dict(obj.get_pointers(schema).items(schema))
+            link_bias = isinstance(obj, s_links.Link)
 
             cols = []
 
@@ -2794,7 +2785,7 @@ class CompositeMetaCommand(MetaCommand):
                 if ptr is not None:
                     ptr_stor_info = types.get_pointer_storage_info(
                         ptr,
-                        link_bias=isinstance(obj, s_links.Link),
+                        link_bias=link_bias,
                         schema=schema,
                     )
                     if ptr_stor_info.column_type != pgtype:
@@ -2855,24 +2846,20 @@ class CompositeMetaCommand(MetaCommand):
         ptrs = {}
 
         if isinstance(obj, s_sources.Source):
+            is_link = isinstance(obj, s_links.Link)
             pointers = list(obj.get_pointers(schema).items(schema))
             # Sort by UUID timestamp for stable VIEW column order.
             pointers.sort(key=lambda p: p[1].id.time)
 
             for ptrname, ptr in pointers:
-                if ptr in exclude_ptrs:
-                    continue
-                if ptr.is_pure_computable(schema):
+                if ptr in exclude_ptrs or ptr.is_pure_computable(schema):
                     continue
                 ptr_stor_info = types.get_pointer_storage_info(
                     ptr,
-                    link_bias=isinstance(obj, s_links.Link),
+                    link_bias=is_link,
                     schema=schema,
                 )
-                if (
-                    isinstance(obj, s_links.Link)
-                    or ptr_stor_info.table_type == 'ObjectType'
-                ):
+                if is_link or ptr_stor_info.table_type == 'ObjectType':
                     ptrs[ptrname] = (
                         ptr_stor_info.column_name,
                         ptr_stor_info.column_type,
@@ -3100,20 +3087,26 @@ class CreateIndex(IndexCommand, adapts=s_indexes.CreateIndex):
     @classmethod
     def create_index(cls, index, schema, context):
         subject = index.get_subject(schema)
+        index_expr = index.get_expr(schema)
+        except_expr = index.get_except_expr(schema)
 
-        singletons = [subject]
-        path_prefix_anchor = ql_ast.Subject().name
-
-        options = qlcompiler.CompilerOptions(
-            modaliases=context.modaliases,
-            schema_object_context=cls.get_schema_metaclass(),
-            anchors={ql_ast.Subject().name: subject},
-            path_prefix_anchor=path_prefix_anchor,
-            singletons=singletons,
-            apply_query_rewrites=False,
-        )
+        # Index expressions usually arrive here already compiled by
+        # the schema-level command, so only set up the compiler when
+        # one of them actually needs it.
+        if (
+            index_expr.irast is None
+            or (except_expr and not except_expr.irast)
+        ):
+            path_prefix_anchor = ql_ast.Subject().name
+            options = qlcompiler.CompilerOptions(
+                modaliases=context.modaliases,
+                schema_object_context=cls.get_schema_metaclass(),
+                anchors={path_prefix_anchor: subject},
+                path_prefix_anchor=path_prefix_anchor,
+                singletons=[subject],
+                apply_query_rewrites=False,
+            )
 
-        index_expr = index.get_expr(schema)
         ir = index_expr.irast
         if ir is None:
             index_expr = type(index_expr).compiled(
@@ -3137,7 +3130,6 @@ class CreateIndex(IndexCommand, adapts=s_indexes.CreateIndex):
         else:
             sql_exprs = [codegen.SQLSourceGenerator.to_source(sql_tree)]
 
-        except_expr = index.get_except_expr(schema)
         if except_expr and not except_expr.irast:
             except_expr = type(except_expr).compiled(
                 except_expr,
@@ -3259,10 +3251,6 @@ class CreateObjectType(ObjectTypeMetaCommand,
 
         self.attach_alter_table(context)
 
-        if self.update_search_indexes:
-            schema = self.update_search_indexes.apply(schema, context)
-            self.pgops.add(self.update_search_indexes)
-
         self.schedule_endpoint_delete_action_update(self.scls, schema, context)
 
         return schema
@@ -3341,10 +3329,6 @@ class AlterObjectType(ObjectTypeMetaCommand,
         if has_table(objtype, schema):
             self.attach_alter_table(context)
 
-            if self.update_search_indexes:
-                schema = self.update_search_indexes.apply(schema, context)
-                self.pgops.add(self.update_search_indexes)
-
         return schema
 
     def _maybe_do_abstract_test(
@@ -3425,8 +3409,11 @@ class PointerMetaCommand(MetaCommand):
                 return objtype
 
     def is_sequence_ptr(self, ptr, schema):
+        # Only scalars can be sequences, so avoid looking up
+        # std::sequence for links and other non-scalar targets.
         return bool(
             (tgt := ptr.get_target(schema))
+            and isinstance(tgt, s_scalars.ScalarType)
             and tgt.issubclass(schema, schema.get('std::sequence'))
         )
 
@@ -3434,21 +3421,23 @@ class PointerMetaCommand(MetaCommand):
         if ptr.is_pure_computable(schema):
             return None
 
-        default = ptr.get_default(schema)
-        default_value = None
+        # Only link property defaults are materialized as column
+        # defaults, so do not bother fetching the default otherwise.
+        if ptr.is_link_property(schema):
+            default = ptr.get_default(schema)
+            if default is not None:
+                return schemamech.ptr_default_to_col_default(
+                    schema, ptr, default)
 
-        if default is not None and ptr.is_link_property(schema):
-            default_value = schemamech.ptr_default_to_col_default(
-                schema, ptr, default)
-        elif self.is_sequence_ptr(ptr, schema):
+        if self.is_sequence_ptr(ptr, schema):
             # TODO: replace this with a generic scalar type default
             #       using std::nextval().
             seq_name = common.quote_literal(
                 common.get_backend_name(
                     schema, ptr.get_target(schema), aspect='sequence'))
-            default_value = f'nextval({seq_name}::regclass)'
+            return f'nextval({seq_name}::regclass)'
 
-        return default_value
+        return None
 
     @classmethod
     def get_columns(cls, pointer, schema, default=None, sets_required=False):
@@ -3574,13 +3563,17 @@ class PointerMetaCommand(MetaCommand):
             alter_table = source_op.get_alter_table(
                 schema, context, manual=True)
 
-            for col in cols:
-                cond = dbops.ColumnExists(
-                    ptr_stor_info.table_name,
-                    column_name=col.name,
+            alter_table.add_operations(
+                (
+                    dbops.AlterTableAddColumn(col),
+                    None,
+                    (dbops.ColumnExists(
+                        ptr_stor_info.table_name,
+                        column_name=col.name,
+                    ),),
                 )
-                op = (dbops.AlterTableAddColumn(col), None, (cond, ))
-                alter_table.add_operation(op)
+                for col in cols
+            )
 
             self.pgops.add(alter_table)
 
@@ -3641,9 +3634,11 @@ class PointerMetaCommand(MetaCommand):
             ref_op = self.get_referrer_context_or_die(context).op
             alter_table = ref_op.get_alter_table(
                 schema, context, manual=True)
+            # DROP COLUMN only needs the column name, so do not bother
+            # rendering the type.
             col = dbops.Column(
                 name=old_ptr_stor_info.column_name,
-                type=common.qname(*old_ptr_stor_info.column_type),
+                type=old_ptr_stor_info.column_type,
             )
             alter_table.add_operation(dbops.AlterTableDropColumn(col))
             self.pgops.add(alter_table)
@@ -3943,7 +3938,7 @@ class PointerMetaCommand(MetaCommand):
         if not sql_expr_is_trivial:
             if need_temp_col:
                 alter_table = source_op.get_alter_table(
-                    schema, context, force_new=True, manual=True)
+                    schema, context, manual=True)
                 temp_column = dbops.Column(
                     name=f'??{pointer.id}_{common.get_unique_random_name()}',
                     type=qt(new_type),
@@ -3981,7 +3976,7 @@ class PointerMetaCommand(MetaCommand):
 
         if changing_col_type or need_temp_col:
             alter_table = source_op.get_alter_table(
-                schema, context, force_new=True, manual=True)
+                schema, context, manual=True)
 
         if is_multi:
             # Remove all rows where the conversion expression produced NULLs.
@@ -4144,7 +4139,7 @@ class PointerMetaCommand(MetaCommand):
             ir = conv_expr.irast
 
         if params := irutils.get_parameters(ir):
-            param = list(params)[0]
+            param = next(iter(params))
             if param.is_global:
                 if param.is_implicit_global:
                     problem = 'functions that reference globals'
@@ -4342,12 +4337,13 @@ class LinkMetaCommand(CompositeMetaCommand, PointerMetaCommand):
         create_c.add_command(c)
 
         if create_children:
-            for l_descendant in link.descendants(schema):
-                if has_table(l_descendant, schema):
-                    lc = LinkMetaCommand._create_table(
-                        l_descendant, schema, context, conditional=True,
-                        create_bases=False, create_children=False)
-                    create_c.add_command(lc)
+            create_c.add_commands(
+                LinkMetaCommand._create_table(
+                    l_descendant, schema, context, conditional=True,
+                    create_bases=False, create_children=False)
+                for l_descendant in link.descendants(schema)
+                if has_table(l_descendant, schema)
+            )
 
         return create_c
 
@@ -4382,13 +4378,10 @@ class LinkMetaCommand(CompositeMetaCommand, PointerMetaCommand):
             ptr_stor_info = types.get_pointer_storage_info(
                 link, resolve_type=False, schema=schema)
 
-            fills_required = any(
-                x.fill_expr for x in
-                self.get_subcommands(
-                    type=s_pointers.AlterPointerLowerCardinality))
-            sets_required = bool(
-                self.get_subcommands(
-                    type=s_pointers.AlterPointerLowerCardinality))
+            lower_card_cmds = self.get_subcommands(
+                type=s_pointers.AlterPointerLowerCardinality)
+            fills_required = any(x.fill_expr for x in lower_card_cmds)
+            sets_required = bool(lower_card_cmds)
 
             if ptr_stor_info.table_type == 'ObjectType':
                 cols = self.get_columns(
@@ -4406,11 +4399,14 @@ class LinkMetaCommand(CompositeMetaCommand, PointerMetaCommand):
                         constr_name = common.edgedb_name_to_pg_name(
                             str(objtype.op.classname) + '.class_check')
 
-                        constr_expr = dbops.Query(textwrap.dedent(f"""\
-                            SELECT
-                                '"__type__" = ' ||
-                                quote_literal({ql(str(objtype.scls.id))})
-                        """), type='text')
+                        # The type id is known here, so spell the check
+                        # out statically.  This keeps the constraint in
+                        # the same ALTER TABLE as the column instead of
+                        # computing it at runtime and running a separate
+                        # dynamic EXECUTE for it.
+                        constr_expr = (
+                            f'"__type__" = {ql(str(objtype.scls.id))}'
+                        )
 
                         cid_constraint = dbops.CheckConstraint(
                             self.table_name,
@@ -4511,7 +4507,7 @@ class LinkMetaCommand(CompositeMetaCommand, PointerMetaCommand):
                     schema, context, manual=True)
                 col = dbops.Column(
                     name=ptr_stor_info.column_name,
-                    type=common.qname(*ptr_stor_info.column_type))
+                    type=ptr_stor_info.column_type)
                 col = dbops.AlterTableDropColumn(col)
                 alter_table.add_operation(col)
                 self.pgops.add(alter_table)
@@ -4794,12 +4790,13 @@ class PropertyMetaCommand(CompositeMetaCommand, PointerMetaCommand):
         create_c.add_command(c)
 
         if create_children:
-            for p_descendant in prop.descendants(schema):
-                if has_table(p_descendant, schema):
-                    pc = PropertyMetaCommand._create_table(
-                        p_descendant, schema, context, conditional=True,
-                        create_bases=False, create_children=False)
-                    create_c.add_command(pc)
+            create_c.add_commands(
+                PropertyMetaCommand._create_table(
+                    p_descendant, schema, context, conditional=True,
+                    create_bases=False, create_children=False)
+                for p_descendant in prop.descendants(schema)
+                if has_table(p_descendant, schema)
+            )
 
         return create_c
 
@@ -4831,13 +4828,10 @@ class PropertyMetaCommand(CompositeMetaCommand, PointerMetaCommand):
             ptr_stor_info = types.get_pointer_storage_info(
                 prop, resolve_type=False, schema=schema)
 
-            fills_required = any(
-                x.fill_expr for x in
-                self.get_subcommands(
-                    type=s_pointers.AlterPointerLowerCardinality))
-            sets_required = bool(
-                self.get_subcommands(
-                    type=s_pointers.AlterPointerLowerCardinality))
+            lower_card_cmds = self.get_subcommands(
+                type=s_pointers.AlterPointerLowerCardinality)
+            fills_required = any(x.fill_expr for x in lower_card_cmds)
+            sets_required = bool(lower_card_cmds)
 
             if (
                 not isinstance(src.scls, s_objtypes.ObjectType)
@@ -4850,7 +4844,6 @@ class PropertyMetaCommand(CompositeMetaCommand, PointerMetaCommand):
                     alter_table = src.op.get_alter_table(
                         schema,
                         context,
-                        force_new=True,
                         manual=True,
                     )
 
@@ -4938,7 +4931,7 @@ class PropertyMetaCommand(CompositeMetaCommand, PointerMetaCommand):
                 or prop.is_link_property(schema)
             ):
                 alter_table = source_op.get_alter_table(
-                    schema, context, force_new=True, manual=True)
+                    schema, context, manual=True)
 
                 # source and target don't have a proper inheritence
                 # hierarchy, so we can't do the source trick for them
@@ -5346,18 +5339,23 @@ class UpdateEndpointDeleteActions(MetaCommand):
         DA = s_links.LinkTargetDeleteAction
 
         if disposition == 'target':
-            groups = itertools.groupby(
-                links, lambda l: l.get_on_target_delete(schema))
+            get_action = lambda l: l.get_on_target_delete(schema)
             near_endpoint, far_endpoint = 'target', 'source'
         else:
-            groups = itertools.groupby(
-                links, lambda l: (
-                    l.get_on_source_delete(schema)
-                    if isinstance(l, s_links.Link)
-                    else s_links.LinkSourceDeleteAction.Allow))
+            get_action = lambda l: (
+                l.get_on_source_delete(schema)
+                if isinstance(l, s_links.Link)
+                else s_links.LinkSourceDeleteAction.Allow)
             near_endpoint, far_endpoint = 'source', 'target'
 
-        for action, links in groups:
+        # Bucket by action in one pass, keeping the order in which
+        # actions are first seen, rather than relying on the input
+        # being sorted by the grouping key.
+        groups: Dict[Any, List[s_pointers.Pointer]] = {}
+        for link in links:
+            groups.setdefault(get_action(link), []).append(link)
+
+        for action, links in groups.items():
             if action is DA.Restrict or action is DA.DeferredRestrict:
                 # Inherited link targets with restrict actions are
                 # elided by apply() to enable us to use inhviews here
@@ -5570,15 +5568,17 @@ class UpdateEndpointDeleteActions(MetaCommand):
         DA = s_links.LinkTargetDeleteAction
 
         if disposition == 'target':
-            groups = itertools.groupby(
-                links, lambda l: l.get_on_target_delete(schema))
+            get_action = lambda l: l.get_on_target_delete(schema)
         else:
-            groups = itertools.groupby(
-                links, lambda l: l.get_on_source_delete(schema))
+            get_action = lambda l: l.get_on_source_delete(schema)
 
         near_endpoint, far_endpoint = 'target', 'source'
 
-        for action, links in groups:
+        groups: Dict[Any, List[s_pointers.Pointer]] = {}
+        for link in links:
+            groups.setdefault(get_action(link), []).append(link)
+
+        for action, links in groups.items():
             if action is DA.Restrict or action is DA.DeferredRestrict:
                 # Inherited link targets with restrict actions are
                 # elided by apply() to enable us to use inhviews here
@@ -5897,8 +5897,11 @@ class UpdateEndpointDeleteActions(MetaCommand):
         for target in all_affected_targets:
             deferred_links = []
             deferred_inline_links = []
-            links = []
-            inline_links = []
+            # Links are emitted ordered by (action, name), so bucket
+            # them by action as we go instead of sorting on a
+            # recomputed (action, name) key afterwards.
+            links_by_action = collections.defaultdict(list)
+            inline_links_by_action = collections.defaultdict(list)
 
             inbound_links = schema.get_referrers(
                 target, scls_type=s_links.Link, field_name='target')
@@ -5934,20 +5937,28 @@ class UpdateEndpointDeleteActions(MetaCommand):
                     if action is DA.DeferredRestrict:
                         deferred_inline_links.append(link)
                     else:
-                        inline_links.append(link)
+                        inline_links_by_action[action].append(link)
                 else:
                     if action is DA.DeferredRestrict:
                         deferred_links.append(link)
                     else:
-                        links.append(link)
-
-            links.sort(
-                key=lambda l: (l.get_on_target_delete(schema),
-                               l.get_name(schema)))
+                        links_by_action[action].append(link)
+
+            links = [
+                link
+                for action in sorted(links_by_action)
+                for link in sorted(
+                    links_by_action[action],
+                    key=lambda l: l.get_name(schema))
+            ]
 
-            inline_links.sort(
-                key=lambda l: (l.get_on_target_delete(schema),
-                               l.get_name(schema)))
+            inline_links = [
+                link
+                for action in sorted(inline_links_by_action)
+                for link in sorted(
+                    inline_links_by_action[action],
+                    key=lambda l: l.get_name(schema))
+            ]
 
             deferred_links.sort(
                 key=lambda l: l.get_name(schema))
@@ -6277,13 +6288,14 @@ class RebaseRole(MetaCommand, RoleMixin, adapts=s_roles.RebaseRole):
         role = self.scls
 
         tenant_id = self._get_tenant_id(context)
+        member = common.get_role_backend_name(
+            str(role.get_name(schema)), tenant_id=tenant_id)
 
         for dropped in self.removed_bases:
             self.pgops.add(dbops.AlterRoleDropMember(
                 name=common.get_role_backend_name(
                     str(dropped.name), tenant_id=tenant_id),
-                member=common.get_role_backend_name(
-                    str(role.get_name(schema)), tenant_id=tenant_id),
+                member=member,
             ))
 
         for bases, _pos in self.added_bases:
@@ -6291,8 +6303,7 @@ class RebaseRole(MetaCommand, RoleMixin, adapts=s_roles.RebaseRole):
                 self.pgops.add(dbops.AlterRoleAddMember(
                     name=common.get_role_backend_name(
                         str(added.name), tenant_id=tenant_id),
-                    member=common.get_role_backend_name(
-                        str(role.get_name(schema)), tenant_id=tenant_id),
+                    member=member,
                 ))
 
         return schema
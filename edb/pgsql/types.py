@@ -143,6 +143,7 @@ def type_has_stable_oid(typ):
     return pg_type is not None and len(pg_type) == 1
 
 
+@functools.lru_cache()
 def get_scalar_base(schema, scalar) -> Tuple[str, ...]:
     base = base_type_name_map.get(scalar.id)
     if base is not None:
@@ -164,27 +165,21 @@ def get_scalar_base(schema, scalar) -> Tuple[str, ...]:
                      f'{scalar.get_name(schema)}')
 
 
+@functools.lru_cache()
 def pg_type_from_scalar(
         schema: s_schema.Schema,
         scalar: s_scalars.ScalarType) -> Tuple[str, ...]:
 
+    builtin_type = base_type_name_map.get(scalar.id)
+    if builtin_type is not None:
+        return builtin_type
+
     if scalar.is_polymorphic(schema):
         return ('anynonarray',)
 
-    is_enum = scalar.is_enum(schema)
-
-    if is_enum:
-        base = scalar
-    else:
-        base = get_scalar_base(schema, scalar)
-
-    column_type = base_type_name_map.get(scalar.id)
-    if column_type:
-        column_type = base
-    else:
-        column_type = common.get_backend_name(schema, scalar, catenate=False)
-
-    return column_type
+    # Enums and user-defined scalars are backed by their own
+    # domain (or enum type) in the backend.
+    return common.get_backend_name(schema, scalar, catenate=False)
 
 
 def pg_type_array(tp: Tuple[str, ...]) -> Tuple[str, ...]:
@@ -313,6 +308,9 @@ def pg_type_from_ir_typeref(
 
 
 class _PointerStorageInfo:
+
+    __slots__ = ('table_name', 'table_type', 'column_name', 'column_type')
+
     @classmethod
     def _source_table_info(cls, schema, pointer):
         table = common.get_backend_name(
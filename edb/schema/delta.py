@@ -76,16 +76,24 @@ def delta_objects(
         if checksum not in unchanged
     )
 
-    oldnames = {o.get_name(old_schema) for o in old}
-    newnames = {o.get_name(new_schema) for o in new}
-    common_names = oldnames & newnames
-
-    pairs = sorted(
-        itertools.product(new, old),
-        key=lambda pair: pair[0].get_name(new_schema) not in common_names,
-    )
+    oldnames = {o: o.get_name(old_schema) for o in old}
+    newnames = {o: o.get_name(new_schema) for o in new}
+    common_names = set(oldnames.values()) & set(newnames.values())
+
+    # Consider the pairs where the new object name is also present
+    # in the old schema first.
+    new_common = []
+    new_other = []
+    for x, x_name in newnames.items():
+        if x_name in common_names:
+            new_common.append(x)
+        else:
+            new_other.append(x)
+    pairs = [(x, y) for xs in (new_common, new_other) for x in xs for y in old]
 
-    full_matrix: List[Tuple[so.Object_T, so.Object_T, float]] = []
+    full_matrix: List[
+        Tuple[so.Object_T, so.Object_T, float, sn.Name, sn.Name]
+    ] = []
 
     # If there are any renames that are already decided on, honor those first
     renames_x: Set[sn.Name] = set()
@@ -127,8 +135,8 @@ def delta_objects(
             return True
 
     for x, y in pairs:
-        x_name = x.get_name(new_schema)
-        y_name = y.get_name(old_schema)
+        x_name = newnames[x]
+        y_name = oldnames[y]
 
         similarity = y.compare(
             x,
@@ -142,13 +150,13 @@ def delta_objects(
         if similarity < 1.0 and not can_alter(y, y_name, x_name):
             similarity = 0.0
 
-        full_matrix.append((x, y, similarity))
+        full_matrix.append((x, y, similarity, x_name, y_name))
 
     full_matrix.sort(
         key=lambda v: (
             1.0 - v[2],
-            str(v[0].get_name(new_schema)),
-            str(v[1].get_name(old_schema)),
+            str(v[3]),
+            str(v[4]),
         ),
     )
 
@@ -163,7 +171,7 @@ def delta_objects(
     comparison_map_y: Dict[so.Object_T, Tuple[float, so.Object_T]] = {}
 
     # Find the top similarity pairs
-    for x, y, similarity in full_matrix:
+    for x, y, similarity, x_name, y_name in full_matrix:
         if x not in seen_x and y not in seen_y:
             comparison_map[x] = (similarity, y)
             comparison_map_y[y] = (similarity, x)
@@ -177,7 +185,7 @@ def delta_objects(
             full_matrix_y[y] = (similarity, x)
 
         if (
-            can_alter(y, y.get_name(old_schema), x.get_name(new_schema))
+            can_alter(y, y_name, x_name)
             and full_matrix_x[x][0] != 1.0
             and full_matrix_y[y][0] != 1.0
         ):
@@ -768,10 +776,14 @@ class Command(
                 )
             )
 
-        if filters:
-            return tuple(filter(lambda i: all(f(i) for f in filters), ops))
-        else:
+        if not filters:
             return tuple(ops)
+        elif len(filters) == 1:
+            # Avoid spinning up an all() generator for every subcommand
+            # in the common single-filter case.
+            return tuple(filter(filters[0], ops))
+        else:
+            return tuple(filter(lambda i: all(f(i) for f in filters), ops))
 
     @overload
     def get_prerequisites(
@@ -2507,12 +2519,7 @@ class ObjectCommand(Command, Generic[so.Object_T]):
         schema: s_schema.Schema,
         context: CommandContext,
     ) -> Dict[str, Any]:
-        result = {}
-
-        for attr in self.enumerate_attributes():
-            result[attr] = self.get_attribute_value(attr)
-
-        return result
+        return {name: op.new_value for name, op in self._attrs.items()}
 
     def get_resolved_attributes(
         self,
@@ -2532,12 +2539,7 @@ class ObjectCommand(Command, Generic[so.Object_T]):
         schema: s_schema.Schema,
         context: CommandContext,
     ) -> Dict[str, Any]:
-        result = {}
-
-        for attr in self.enumerate_attributes():
-            result[attr] = self.get_orig_attribute_value(attr)
-
-        return result
+        return {name: op.old_value for name, op in self._attrs.items()}
 
     def get_specified_attribute_value(
         self,
@@ -3108,12 +3110,8 @@ class AlterObjectOrFragment(ObjectCommand[so.Object_T]):
         update: Mapping[str, bool],
     ) -> None:
         cur_comp_fields = self.scls.get_computed_fields(schema)
-        comp_fields = set(cur_comp_fields)
-        for fn, computed in update.items():
-            if computed:
-                comp_fields.add(fn)
-            else:
-                comp_fields.discard(fn)
+        comp_fields = set(cur_comp_fields).difference(update)
+        comp_fields.update(fn for fn, computed in update.items() if computed)
 
         if cur_comp_fields != comp_fields:
             if comp_fields:
@@ -529,10 +529,11 @@ class CreateParameter(ParameterCommand, sd.CreateObject[Parameter]):
         context: sd.CommandContext,
     ) -> sd.Command:
         cmd = super()._cmd_tree_from_ast(schema, astnode, context)
+        assert isinstance(cmd, sd.ObjectCommand)
 
-        for sub in cmd.get_subcommands(type=sd.AlterObjectProperty):
-            if sub.property == 'default':
-                sub.new_value = [sub.new_value]
+        default = cmd._get_simple_attribute_set_cmd('default')
+        if default is not None:
+            default.new_value = [default.new_value]
 
         return cmd
 
@@ -561,9 +561,12 @@ def delta_bases(
     new_bases: Iterable[sn.Name],
     t: Type[so.InheritingObjectT],
 ) -> BaseDelta_T[so.InheritingObjectT]:
-    dropped = frozenset(old_bases) - frozenset(new_bases)
-    removed_bases = [so.ObjectShell(name=b, schemaclass=t) for b in dropped]
-    common_bases = [b for b in old_bases if b not in dropped]
+    new_set = frozenset(new_bases)
+    removed_bases = [
+        so.ObjectShell(name=b, schemaclass=t)
+        for b in old_bases if b not in new_set
+    ]
+    common_bases = [b for b in old_bases if b in new_set]
 
     added_bases: List[BaseDeltaItem_T[so.InheritingObjectT]] = []
     j = 0
@@ -591,9 +594,10 @@ def delta_bases(
             added_set.add(base)
 
     # Finally, add all remaining bases to the end of the list
+    common_set = frozenset(common_bases)
     tail_bases = added_base_refs + [
         so.ObjectShell(name=b, schemaclass=t) for b in new_bases
-        if b not in added_set and b not in common_bases
+        if b not in added_set and b not in common_set
     ]
 
     if tail_bases:
@@ -923,12 +927,8 @@ class AlterInheritingObjectOrFragment(
         update: Mapping[str, bool],
     ) -> None:
         cur_inh_fields = self.scls.get_inherited_fields(schema)
-        inh_fields = set(cur_inh_fields)
-        for fn, inherited in update.items():
-            if inherited:
-                inh_fields.add(fn)
-            else:
-                inh_fields.discard(fn)
+        inh_fields = set(cur_inh_fields).difference(update)
+        inh_fields.update(fn for fn, inherited in update.items() if inherited)
 
         if cur_inh_fields != inh_fields:
             if inh_fields:
@@ -1126,14 +1126,15 @@ class RebaseInheritingObject(
 
         removed_bases = {b.name for b in self.removed_bases}
         existing_bases = set()
+        kept_bases = []
 
         for b in bases:
-            if b.get_name(schema) in removed_bases:
-                bases.remove(b)
-            else:
-                existing_bases.add(b.get_name(schema))
+            bname = b.get_name(schema)
+            if bname not in removed_bases:
+                kept_bases.append(b)
+                existing_bases.add(bname)
 
-        index = {b.get_name(schema): i for i, b in enumerate(bases)}
+        bases = kept_bases
 
         for new_bases, pos in self.added_bases:
             if isinstance(pos, tuple):
@@ -1144,6 +1145,9 @@ class RebaseInheritingObject(
             elif pos == 'FIRST':
                 idx = 0
             else:
+                # Positional references are rare, so only index
+                # the current bases when one is actually used.
+                index = {b.get_name(schema): i for i, b in enumerate(bases)}
                 idx = index[ref.name]
 
             bases[idx:idx] = [
@@ -1151,7 +1155,6 @@ class RebaseInheritingObject(
                     schema, context, name=b.name, sourcectx=b.sourcectx)
                 for b in new_bases if b.name not in existing_bases
             ]
-            index = {b.get_name(schema): i for i, b in enumerate(bases)}
 
         if not bases and default_base:
             bases = [default_base]
@@ -227,6 +227,7 @@ def quals_from_fullname(fullname: QualName) -> List[str]:
     )
 
 
+@functools.lru_cache(10240)
 def get_specialized_name(basename: Name, *qualifiers: str) -> str:
     mangled_quals = '@'.join(mangle_name(qual) for qual in qualifiers if qual)
     return f'{mangle_name(str(basename))}@{mangled_quals}'
@@ -26,6 +26,7 @@ import collections.abc
 import copy
 import enum
 import functools
+import itertools
 import uuid
 
 from edb import errors
@@ -3311,10 +3312,15 @@ def _merge_lineage(
         if not nonempty:
             return result
 
+        # Collect the tails once per step instead of rescanning every
+        # line for each candidate.
+        tails: Set[Any] = set()
+        for line in nonempty:
+            tails.update(itertools.islice(line, 1, None))
+
         for line in nonempty:
             candidate = line[0]
-            tails = [m for m in nonempty if candidate in m[1:]]
-            if not tails:
+            if candidate not in tails:
                 break
         else:
             raise errors.SchemaError(
@@ -3332,14 +3338,33 @@ def _compute_lineage(
     schema: s_schema.Schema,
     obj: InheritingObjectT,
     subject_name: str,
+    memo: Dict[InheritingObjectT, List[InheritingObjectT]],
 ) -> List[InheritingObjectT]:
+    # Diamond-shaped hierarchies reach the same ancestor through
+    # several paths, so remember the lineage of every object we have
+    # already merged.  _merge_lineage() consumes its input lists,
+    # hence the copies.
+    try:
+        return list(memo[obj])
+    except KeyError:
+        pass
+
     bases = tuple(obj.get_bases(schema).objects(schema))
-    lineage = [[obj]]
 
-    for base in bases:
-        lineage.append(_compute_lineage(schema, base, subject_name))
+    if len(bases) == 1:
+        # Single inheritance, the merge degenerates to concatenation.
+        result = [obj]
+        result.extend(_compute_lineage(schema, bases[0], subject_name, memo))
+    else:
+        lineage = [[obj]]
+        for base in bases:
+            lineage.append(
+                _compute_lineage(schema, base, subject_name, memo))
 
-    return _merge_lineage(lineage, subject_name)
+        result = _merge_lineage(lineage, subject_name)
+
+    memo[obj] = result
+    return list(result)
 
 
 def compute_lineage(
@@ -3347,9 +3372,13 @@ def compute_lineage(
     bases: Iterable[InheritingObjectT],
     subject_name: str,
 ) -> List[InheritingObjectT]:
+    memo: Dict[InheritingObjectT, List[InheritingObjectT]] = {}
     lineage = []
     for base in bases:
-        lineage.append(_compute_lineage(schema, base, subject_name))
+        lineage.append(_compute_lineage(schema, base, subject_name, memo))
+
+    if len(lineage) == 1:
+        return lineage[0]
 
     return _merge_lineage(lineage, subject_name)
 
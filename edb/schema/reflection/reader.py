@@ -133,6 +133,9 @@ def parse_into(
             if field is None:
                 continue
             findex = field.index
+            # Key of this field in the per-object referrer maps, built
+            # once here rather than for every referenced id below.
+            refkey = (mcls, fn)
 
             if desc.storage is not None:
                 if v is None:
@@ -145,10 +148,10 @@ def parse_into(
                     else:
                         val = base_schema.get_by_id(refid)
                     objdata[findex] = val.schema_reduce()
-                    refs_to[val.id][mcls, fn][objid] = None
+                    refs_to[val.id][refkey][objid] = None
 
                 elif desc.storage.ptrkind == 'multi link':
-                    ftype = mcls.get_field(fn).type
+                    ftype = field.type
                     if issubclass(ftype, s_obj.ObjectDict):
                         refids = ftype._container(
                             uuidgen.UUID(e['value']) for e in v)
@@ -160,23 +163,23 @@ def parse_into(
                         val = ftype(refids, _private_init=True)
                     objdata[findex] = val.schema_reduce()
                     for refid in refids:
-                        refs_to[refid][mcls, fn][objid] = None
+                        refs_to[refid][refkey][objid] = None
 
                 elif desc.storage.shadow_ptrkind:
                     val = entry[f'{k}__internal']
-                    ftype = mcls.get_field(fn).type
+                    ftype = field.type
                     if val is not None and type(val) is not ftype:
                         if issubclass(ftype, s_expr.Expression):
                             val = _parse_expression(val)
                             for refid in val.refs.ids(schema):
-                                refs_to[refid][mcls, fn][objid] = None
+                                refs_to[refid][refkey][objid] = None
                         elif issubclass(ftype, s_expr.ExpressionList):
                             exprs = []
                             for e_dict in val:
                                 e = _parse_expression(e_dict)
                                 assert e.refs is not None
                                 for refid in e.refs.ids(schema):
-                                    refs_to[refid][mcls, fn][objid] = None
+                                    refs_to[refid][refkey][objid] = None
                                 exprs.append(e)
                             val = ftype(exprs)
                         elif issubclass(ftype, s_obj.Object):
@@ -191,7 +194,7 @@ def parse_into(
                     objdata[findex] = val
 
                 else:
-                    ftype = mcls.get_field(fn).type
+                    ftype = field.type
                     if type(v) is not ftype:
                         if issubclass(ftype, verutils.Version):
                             objdata[findex] = _parse_version(v)
@@ -201,10 +204,10 @@ def parse_into(
                         objdata[findex] = v
 
             elif desc.is_refdict:
-                ftype = mcls.get_field(fn).type
+                ftype = field.type
                 refids = ftype._container(uuidgen.UUID(e['id']) for e in v)
                 for refid in refids:
-                    refs_to[refid][mcls, fn][objid] = None
+                    refs_to[refid][refkey][objid] = None
 
                 val = ftype(refids, _private_init=True)
                 objdata[findex] = val.schema_reduce()
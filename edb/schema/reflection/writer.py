@@ -40,6 +40,13 @@ from edb.schema import types as s_types
 from edb.schema.reflection import structure as sr_struct
 
 
+# Query arguments are only ever read back by the backend, so encode
+# them compactly.  Reusing one encoder instance also avoids the
+# per-call encoder construction json.dumps() does for non-default
+# arguments.
+_json_encode = json.JSONEncoder(separators=(',', ':')).encode
+
+
 @functools.singledispatch
 def write_meta(
     cmd: sd.Command,
@@ -156,6 +163,37 @@ def write_meta_delta_root(
     )
 
 
+# Explicit NULL assignments for every non-link field stored in the
+# reflection layout of a schema class, keyed by the class.  The layout
+# is kept alongside, so that a different class layout is never served
+# stale entries.
+_create_empties: Dict[
+    Type[so.Object],
+    Tuple[sr_struct.SchemaTypeLayout, Dict[str, None]],
+] = {}
+
+
+def _get_create_empties(
+    mcls: Type[so.Object],
+    layout: sr_struct.SchemaTypeLayout,
+) -> Dict[str, None]:
+    cached = _create_empties.get(mcls)
+    if cached is not None and cached[0] is layout:
+        return cached[1]
+
+    empties: Dict[str, None] = {
+        v.fieldname: None for f, v in layout.items()
+        if (
+            f != 'backend_id'
+            and v.storage is not None
+            and v.storage.ptrkind != 'link'
+            and v.storage.ptrkind != 'multi link'
+        )
+    }
+    _create_empties[mcls] = (layout, empties)
+    return empties
+
+
 def _build_object_mutation_shape(
     cmd: sd.ObjectCommand[so.Object],
     *,
@@ -189,18 +227,15 @@ def _build_object_mutation_shape(
     for sub in cmd.get_subcommands(type=s_ref.AlterOwned):
         props.update(sub.get_resolved_attributes(schema, context))
 
+    if not props and not isinstance(cmd, sd.CreateObject):
+        # Alters that only carry subcommands (which is common for
+        # commands propagated to descendants) have nothing to write.
+        return '', {}
+
     assignments = []
     variables: Dict[str, str] = {}
     if isinstance(cmd, sd.CreateObject):
-        empties = {
-            v.fieldname: None for f, v in layout.items()
-            if (
-                f != 'backend_id'
-                and v.storage is not None
-                and v.storage.ptrkind != 'link'
-                and v.storage.ptrkind != 'multi link'
-            )
-        }
+        empties = _get_create_empties(mcls, layout)
         all_props = {**empties, **props}
     else:
         all_props = props
@@ -256,22 +291,20 @@ def _build_object_mutation_shape(
             args = props.get('args', [])
             target_value = []
             if v is not None:
+                nargs = len(args)
                 for i, param in enumerate(v.objects(schema)):
-                    if i == 0:
-                        # skip the implicit __subject__ parameter
+                    if i == 0 or i > nargs:
+                        # skip the implicit __subject__ parameter,
+                        # and parameters without an argument
                         arg_expr = ''
+                    elif (
+                        param.get_kind(schema)
+                        is qltypes.ParameterKind.VariadicParam
+                    ):
+                        rest = [arg.text for arg in args[i - 1:]]
+                        arg_expr = f'[{",".join(rest)}]'
                     else:
-                        try:
-                            arg = args[i - 1]
-                        except IndexError:
-                            arg_expr = ''
-                        else:
-                            pkind = param.get_kind(schema)
-                            if pkind is qltypes.ParameterKind.VariadicParam:
-                                rest = [arg.text for arg in args[i - 1:]]
-                                arg_expr = f'[{",".join(rest)}]'
-                            else:
-                                arg_expr = arg.text
+                        arg_expr = args[i - 1].text
 
                     target_value.append((str(param.id), arg_expr))
 
@@ -280,10 +313,10 @@ def _build_object_mutation_shape(
             assignments.append(f'{ns}__internal := <str>${var_n}__internal')
             if v is not None:
                 target_value = mcls.get_displayname_static(v)
-                variables[f'{var_n}__internal'] = json.dumps(str(v))
+                variables[f'{var_n}__internal'] = _json_encode(str(v))
             else:
                 target_value = None
-                variables[f'{var_n}__internal'] = json.dumps(None)
+                variables[f'{var_n}__internal'] = _json_encode(None)
 
         elif isinstance(target, s_objtypes.ObjectType):
             if cardinality is qltypes.SchemaCardinality.Many:
@@ -347,11 +380,11 @@ def _build_object_mutation_shape(
             assignments.append(f'{ns}__internal := {shadow_target_expr}')
             if v is not None:
                 ids = [str(i) for i in v.refs.ids(schema)]
-                variables[f'{var_n}_expr'] = json.dumps(
+                variables[f'{var_n}_expr'] = _json_encode(
                     {'text': v.text, 'refs': ids}
                 )
             else:
-                variables[f'{var_n}_expr'] = json.dumps(None)
+                variables[f'{var_n}_expr'] = _json_encode(None)
 
         elif ftype is sr_struct.FieldType.EXPR_LIST:
             target_expr = f'''
@@ -416,7 +449,7 @@ def _build_object_mutation_shape(
         else:
             assignments.append(f'{ns} := {target_expr}')
 
-        variables[var_n] = json.dumps(target_value)
+        variables[var_n] = _json_encode(target_value)
 
     if isinstance(cmd, sd.CreateObject):
         if (
@@ -435,7 +468,7 @@ def _build_object_mutation_shape(
                     f'backend_id := sys::_get_pg_type_for_edgedb_type('
                     f'<uuid>$__{var_prefix}id, <uuid>{{}})'
                 )
-            variables[f'__{var_prefix}id'] = json.dumps(
+            variables[f'__{var_prefix}id'] = _json_encode(
                 str(cmd.get_attribute_value('id')))
 
     shape = ',\n'.join(assignments)
@@ -613,7 +646,7 @@ def write_meta_create_object(
                 '''
 
                 variables[f'__{target_link}'] = (
-                    json.dumps(str(target.get_name(schema)))
+                    _json_encode(str(target.get_name(schema)))
                 )
 
                 shadow_clslayout = classlayout[refcls]
@@ -668,7 +701,7 @@ def write_meta_create_object(
             '''
 
             ref_name = context.get_referrer_name(refctx)
-            variables['__parent_classname'] = json.dumps(str(ref_name))
+            variables['__parent_classname'] = _json_encode(str(ref_name))
             blocks.append((parent_update_query, variables))
 
     _descend(
@@ -723,7 +756,7 @@ def write_meta_alter_object(
                     {shape}
                 }};
             '''
-            variables['__classname'] = json.dumps(str(cmd.classname))
+            variables['__classname'] = _json_encode(str(cmd.classname))
             blocks.append((query, variables))
 
         if isinstance(cmd, s_ref.ReferencedObjectCommand):
@@ -810,9 +843,10 @@ def _update_lprops(
 
     if shape:
         parent_variables = {}
-        parent_variables[f'__{target_link}'] = json.dumps(str(target_obj.id))
+        parent_variables[f'__{target_link}'] = _json_encode(
+            str(target_obj.id))
         ref_name = context.get_referrer_name(refctx)
-        parent_variables['__parent_classname'] = json.dumps(str(ref_name))
+        parent_variables['__parent_classname'] = _json_encode(str(ref_name))
 
         # XXX: we have to do a -= followed by a += because
         # support for filtered nested link property updates
@@ -832,7 +866,7 @@ def _update_lprops(
 
         if reflect_as_link:
             parent_variables[f'__{target_link}_shadow'] = (
-                json.dumps(str(cmd.classname)))
+                _json_encode(str(cmd.classname)))
 
             assignments.append(textwrap.dedent(
                 f'''\
@@ -963,7 +997,7 @@ def write_meta_delete_object(
             parent_variables = {}
 
             parent_variables[f'__{target_link}'] = (
-                json.dumps(str(target.id))
+                _json_encode(str(target.id))
             )
 
             parent_update_query = f'''
@@ -979,7 +1013,7 @@ def write_meta_delete_object(
 
             ref_name = context.get_referrer_name(refctx)
             parent_variables['__parent_classname'] = (
-                json.dumps(str(ref_name))
+                _json_encode(str(ref_name))
             )
 
             blocks.append((parent_update_query, parent_variables))
@@ -998,7 +1032,7 @@ def write_meta_delete_object(
                        FILTER .name__internal = <str>$__classname),
             SELECT {{{", ".join(operations)}}};
         '''
-        variables = {'__classname': json.dumps(str(cmd.classname))}
+        variables = {'__classname': _json_encode(str(cmd.classname))}
         blocks.append((query, variables))
 
 
@@ -673,7 +673,8 @@ def get_class_nearest_common_ancestors(
     common = set(first).intersection(
         *[set(c.get_ancestors(schema).objects(schema)) | {c}
           for c in classes[1:]])
-    common_list = sorted(common, key=lambda i: first.index(i))
+    # Keep the order of the first class's ancestry.
+    common_list = [c for c in first if c in common]
     nearests: List[so.InheritingObjectT] = []
     # Then find the common ancestors that don't have any subclasses that
     # are also nearest common ancestors.
@@ -1176,9 +1177,7 @@ def get_config_type_shape(
     shape = []
     seen: Set[str] = set()
 
-    stypes = [stype] + list(stype.descendants(schema))
-
-    for t in stypes:
+    for t in itertools.chain((stype,), stype.descendants(schema)):
         t_name = t.get_name(schema)
 
         for unqual_pn, p in t.get_pointers(schema).items(schema):
@@ -362,13 +362,25 @@ async def _store_static_bin_cache(
     key: str,
     data: bytes,
 ) -> None:
+    await _store_static_bin_caches(ctx, {key: data})
 
-    text = f"""\
-        INSERT INTO edgedbinstdata.instdata (key, bin)
-        VALUES(
+
+async def _store_static_bin_caches(
+    ctx: BootstrapContext,
+    entries: Mapping[str, bytes],
+) -> None:
+
+    values = ',\n'.join(
+        f"""(
             {pg_common.quote_literal(key)},
             {pg_common.quote_bytea_literal(data)}::bytea
-        )
+        )"""
+        for key, data in entries.items()
+    )
+
+    text = f"""\
+        INSERT INTO edgedbinstdata.instdata (key, bin)
+        VALUES {values}
     """
 
     await _execute(ctx.conn, text)
@@ -960,29 +972,17 @@ async def _init_stdlib(
 
     stdlib = stdlib._replace(stdschema=schema)
 
-    await _store_static_bin_cache(
-        ctx,
-        'stdschema',
-        pickle.dumps(schema, protocol=pickle.HIGHEST_PROTOCOL),
-    )
-
-    await _store_static_bin_cache(
-        ctx,
-        'reflschema',
-        pickle.dumps(stdlib.reflschema, protocol=pickle.HIGHEST_PROTOCOL),
-    )
-
-    await _store_static_bin_cache(
-        ctx,
-        'global_schema',
-        pickle.dumps(stdlib.global_schema, protocol=pickle.HIGHEST_PROTOCOL),
-    )
-
-    await _store_static_bin_cache(
-        ctx,
-        'classlayout',
-        pickle.dumps(stdlib.classlayout, protocol=pickle.HIGHEST_PROTOCOL),
-    )
+    # Store all the pickled schema bits with one statement.
+    await _store_static_bin_caches(ctx, {
+        'stdschema': pickle.dumps(
+            schema, protocol=pickle.HIGHEST_PROTOCOL),
+        'reflschema': pickle.dumps(
+            stdlib.reflschema, protocol=pickle.HIGHEST_PROTOCOL),
+        'global_schema': pickle.dumps(
+            stdlib.global_schema, protocol=pickle.HIGHEST_PROTOCOL),
+        'classlayout': pickle.dumps(
+            stdlib.classlayout, protocol=pickle.HIGHEST_PROTOCOL),
+    })
 
     await _store_static_text_cache(
         ctx,
@@ -1040,16 +1040,8 @@ async def _init_stdlib(
                     .id,
                     <uuid>{}
                 )
-            }
-            ''',
-            expected_cardinality_one=False,
-        )
-        await conn.sql_execute(sql.encode("utf-8"))
+            };
 
-        _, sql = compile_bootstrap_script(
-            compiler,
-            stdlib.reflschema,
-            '''
             UPDATE schema::Array
             FILTER
                 .builtin
@@ -1059,7 +1051,7 @@ async def _init_stdlib(
                     .id,
                     .element_type.id,
                 )
-            }
+            };
             ''',
             expected_cardinality_one=False,
         )
@@ -414,11 +414,23 @@ class Compiler:
             stdmode=ctx.bootstrap_mode,
         )
 
+        if not meta_blocks:
+            # Nothing to reflect.
+            return
+
         cache = current_tx.get_cached_reflection()
 
+        # The same reflection statement text is typically emitted for
+        # many objects in a delta, so only hash each distinct text once.
+        eql_hashes: Dict[str, str] = {}
+
         with cache.mutate() as cache_mm:
             for eql, args in meta_blocks:
-                eql_hash = hashlib.sha1(eql.encode()).hexdigest()
+                try:
+                    eql_hash = eql_hashes[eql]
+                except KeyError:
+                    eql_hash = hashlib.sha1(eql.encode()).hexdigest()
+                    eql_hashes[eql] = eql_hash
                 fname = ('edgedb', f'__rh_{eql_hash}')
 
                 if eql_hash in cache_mm:
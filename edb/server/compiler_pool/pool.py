@@ -129,7 +129,7 @@ class BaseWorker:
             raise exc
 
     async def _request(self, method_name, args):
-        msg = pickle.dumps((method_name, args))
+        msg = pickle.dumps((method_name, args), -1)
         return await self._con.request(msg)
 
 
@@ -973,7 +973,7 @@ class RemoteWorker(BaseWorker):
         self._con.abort()
 
     async def _request(self, method_name, args):
-        msg = pickle.dumps((method_name, args))
+        msg = pickle.dumps((method_name, args), -1)
         digest = hmac.digest(self._secret, msg, "sha256")
         return await self._con.request(digest + msg)
 
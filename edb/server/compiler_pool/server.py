@@ -180,7 +180,7 @@ class Worker(pool_mod.Worker):
             )
 
         if msg is None:
-            msg = pickle.dumps((method_name, args))
+            msg = pickle.dumps((method_name, args), -1)
         return await self._con.request(msg)
 
 
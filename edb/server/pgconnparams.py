@@ -60,6 +60,9 @@ class ConnectionParameters:
 
 _system = platform.uname().system
 
+_pgpass_field_sep_re = re.compile(r'(?<!\\):')
+_ipv6_hostspec_re = re.compile(r'(?:\[([^\]]+)\])(?::([0-9]+))?')
+
 
 if _system == 'Windows':
     import ctypes.wintypes
@@ -119,7 +122,7 @@ def _read_password_file(passfile: pathlib.Path) -> List[Tuple[str, ...]]:
                 line = line.replace(R'\\', '\n')
                 passtab.append(tuple(
                     p.replace('\n', R'\\')
-                    for p in re.split(r'(?<!\\):', line, maxsplit=4)
+                    for p in _pgpass_field_sep_re.split(line, maxsplit=4)
                 ))
     except IOError:
         pass
@@ -223,7 +226,7 @@ def _parse_hostlist(
             hostspec_port = ''
         elif hostspec[0] == '[':
             # IPv6 address
-            m = re.match(r'(?:\[([^\]]+)\])(?::([0-9]+))?', hostspec)
+            m = _ipv6_hostspec_re.match(hostspec)
             if m:
                 addr = m.group(1)
                 hostspec_port = m.group(2)
@@ -655,7 +655,9 @@ class Server(ha_base.ClusterProtocol):
 
     async def introspect_user_schema(self, conn):
         json_data = await conn.sql_fetch_val(self._local_intro_query)
+        return self._parse_user_schema(json_data)
 
+    def _parse_user_schema(self, json_data):
         base_schema = s_schema.ChainedSchema(
             self._std_schema,
             s_schema.FlatSchema(),
@@ -708,43 +710,48 @@ class Server(ha_base.ClusterProtocol):
             return
 
         try:
-            user_schema = await self.introspect_user_schema(conn)
-
-            reflection_cache_json = await conn.sql_fetch_val(
+            # The introspection queries are independent of each other,
+            # so fetch everything in a single round-trip.
+            (
+                (user_schema_json,),
+                (reflection_cache_json, backend_ids_json),
+                (db_config_json,),
+            ) = await conn.sql_fetch((
+                self._local_intro_query,
                 b'''
-                    SELECT json_agg(o.c)
-                    FROM (
-                        SELECT
-                            json_build_object(
-                                'eql_hash', t.eql_hash,
-                                'argnames', array_to_json(t.argnames)
-                            ) AS c
-                        FROM
-                            ROWS FROM(edgedb._get_cached_reflection())
-                                AS t(eql_hash text, argnames text[])
-                    ) AS o;
+                    SELECT
+                        (SELECT json_agg(o.c)
+                         FROM (
+                            SELECT
+                                json_build_object(
+                                    'eql_hash', t.eql_hash,
+                                    'argnames', array_to_json(t.argnames)
+                                ) AS c
+                            FROM
+                                ROWS FROM(edgedb._get_cached_reflection())
+                                    AS t(eql_hash text, argnames text[])
+                         ) AS o),
+                        (SELECT
+                            json_object_agg(
+                                "id"::text,
+                                "backend_id"
+                            )::text
+                         FROM
+                            edgedb."_SchemaType");
                 ''',
-            )
+                self.get_sys_query('dbconfig'),
+            ))
+
+            user_schema = self._parse_user_schema(user_schema_json)
 
             reflection_cache = immutables.Map({
                 r['eql_hash']: tuple(r['argnames'])
                 for r in json.loads(reflection_cache_json)
             })
 
-            backend_ids_json = await conn.sql_fetch_val(
-                b'''
-                SELECT
-                    json_object_agg(
-                        "id"::text,
-                        "backend_id"
-                    )::text
-                FROM
-                    edgedb."_SchemaType"
-                ''',
-            )
             backend_ids = json.loads(backend_ids_json)
 
-            db_config = await self.introspect_db_config(conn)
+            db_config = self._parse_db_config(db_config_json)
 
             assert self._dbindex is not None
             self._dbindex.register_db(
@@ -759,7 +766,10 @@ class Server(ha_base.ClusterProtocol):
 
     async def introspect_db_config(self, conn):
         result = await conn.sql_fetch_val(self.get_sys_query('dbconfig'))
-        return config.from_json(config.get_settings(), result)
+        return self._parse_db_config(result)
+
+    def _parse_db_config(self, json_data):
+        return config.from_json(config.get_settings(), json_data)
 
     async def _early_introspect_db(self, dbname):
         """We need to always introspect the extensions for each database.
@@ -836,20 +846,46 @@ class Server(ha_base.ClusterProtocol):
                 num, kind, patch, schema, self._refl_schema,
                 self._schema_class_layout, self.get_backend_runtime_params())
 
-            patches[num] = (sql, syssql, schema)
+            # Encode the patch SQL once here rather than separately
+            # for every database the patch is applied to.
+            patches[num] = (
+                tuple(x.encode('utf-8') for x in sql),
+                tuple(x.encode('utf-8') for x in syssql),
+                schema,
+            )
 
         return patches
 
     async def _maybe_apply_patches(self, dbname, conn, patches, sys=False):
         """Apply any un-applied patches to the database."""
-        num_patches = await self.get_patch_count(conn)
-        for num, (sql, syssql, _) in patches.items():
+        if sys:
+            # The patches were prepared from the system db's patch
+            # count, so there's no need to fetch it again.
+            num_patches = min(patches)
+        else:
+            num_patches = await self.get_patch_count(conn)
+
+        # Send all the pending patches in one go, so that they are
+        # applied in a single round-trip and a single transaction.
+        # This uses the simple query protocol, which parses each
+        # statement only after the previous one has been executed,
+        # so a patch can rely on objects created by earlier ones.
+        sql: tuple[bytes, ...] = ()
+        applied = []
+        for num, (patch_sql, syssql, _) in patches.items():
             if num_patches <= num:
+                sql += patch_sql
                 if sys:
                     sql += syssql
-                logger.info("applying patch %d to database '%s'", num, dbname)
-                sql = tuple(x.encode('utf-8') for x in sql)
-                await conn.sql_fetch(sql)
+                applied.append(num)
+        if sql:
+            logger.info(
+                "applying patches %d..%d to database '%s' as one batch",
+                applied[0], applied[-1], dbname)
+            await conn.sql_execute(sql)
+            logger.debug(
+                "applied patches %d..%d to database '%s'",
+                applied[0], applied[-1], dbname)
 
     async def _maybe_patch_db(self, dbname, patches):
         logger.info("applying patches to database '%s'", dbname)
@@ -909,64 +945,59 @@ class Server(ha_base.ClusterProtocol):
 
     async def _load_instance_data(self):
         async with self._use_sys_pgcon() as syscon:
-            result = await syscon.sql_fetch_val(b'''\
-                SELECT json::json FROM edgedbinstdata.instdata
-                WHERE key = 'instancedata';
+            # Fetch all the entries we need in a single round-trip
+            # instead of querying instdata once per key.
+            rows = await syscon.sql_fetch(b'''\
+                SELECT key, json::json, text, bin
+                FROM edgedbinstdata.instdata
+                WHERE key = ANY(ARRAY[
+                    'instancedata',
+                    'sysqueries',
+                    'local_intro_query',
+                    'global_intro_query',
+                    'stdschema',
+                    'reflschema',
+                    'classlayout',
+                    'report_configs_typedesc'
+                ]);
             ''')
-            self._instance_data = immutables.Map(json.loads(result))
+            instdata = {row[0].decode(): row[1:] for row in rows}
 
-            result = await syscon.sql_fetch_val(b'''\
-                SELECT json::json FROM edgedbinstdata.instdata
-                WHERE key = 'sysqueries';
-            ''')
-            queries = json.loads(result)
-            self._sys_queries = immutables.Map(
-                {k: q.encode() for k, q in queries.items()})
+        json_col, text_col, bin_col = 0, 1, 2
 
-            self._local_intro_query = await syscon.sql_fetch_val(b'''\
-                SELECT text FROM edgedbinstdata.instdata
-                WHERE key = 'local_intro_query';
-            ''')
+        self._instance_data = immutables.Map(
+            json.loads(instdata['instancedata'][json_col]))
 
-            self._global_intro_query = await syscon.sql_fetch_val(b'''\
-                SELECT text FROM edgedbinstdata.instdata
-                WHERE key = 'global_intro_query';
-            ''')
+        queries = json.loads(instdata['sysqueries'][json_col])
+        self._sys_queries = immutables.Map(
+            {k: q.encode() for k, q in queries.items()})
 
-            result = await syscon.sql_fetch_val(b'''\
-                SELECT bin FROM edgedbinstdata.instdata
-                WHERE key = 'stdschema';
-            ''')
-            try:
-                self._std_schema = pickle.loads(result[2:])
-            except Exception as e:
-                raise RuntimeError(
-                    'could not load std schema pickle') from e
-
-            result = await syscon.sql_fetch_val(b'''\
-                SELECT bin FROM edgedbinstdata.instdata
-                WHERE key = 'reflschema';
-            ''')
-            try:
-                self._refl_schema = pickle.loads(result[2:])
-            except Exception as e:
-                raise RuntimeError(
-                    'could not load refl schema pickle') from e
-
-            result = await syscon.sql_fetch_val(b'''\
-                SELECT bin FROM edgedbinstdata.instdata
-                WHERE key = 'classlayout';
-            ''')
-            try:
-                self._schema_class_layout = pickle.loads(result[2:])
-            except Exception as e:
-                raise RuntimeError(
-                    'could not load schema class layout pickle') from e
-
-            self._report_config_typedesc = await syscon.sql_fetch_val(b'''\
-                SELECT bin FROM edgedbinstdata.instdata
-                WHERE key = 'report_configs_typedesc';
-            ''')
+        self._local_intro_query = instdata['local_intro_query'][text_col]
+        self._global_intro_query = instdata['global_intro_query'][text_col]
+
+        result = instdata['stdschema'][bin_col]
+        try:
+            self._std_schema = pickle.loads(result[2:])
+        except Exception as e:
+            raise RuntimeError(
+                'could not load std schema pickle') from e
+
+        result = instdata['reflschema'][bin_col]
+        try:
+            self._refl_schema = pickle.loads(result[2:])
+        except Exception as e:
+            raise RuntimeError(
+                'could not load refl schema pickle') from e
+
+        result = instdata['classlayout'][bin_col]
+        try:
+            self._schema_class_layout = pickle.loads(result[2:])
+        except Exception as e:
+            raise RuntimeError(
+                'could not load schema class layout pickle') from e
+
+        self._report_config_typedesc = (
+            instdata['report_configs_typedesc'][bin_col])
 
     def get_roles(self):
         return self._roles
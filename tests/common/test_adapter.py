@@ -0,0 +1,72 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2016-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import unittest
+
+from edb.common import adapter
+
+
+class TestAdapter(unittest.TestCase):
+
+    def test_adapter_lookup_01(self):
+        class A:
+            pass
+
+        class B(A):
+            pass
+
+        class C(B):
+            pass
+
+        class Meta(adapter.Adapter):
+            pass
+
+        class AdaptedA(metaclass=Meta, adapts=A):
+            pass
+
+        class AdaptedB(AdaptedA, adapts=B):
+            pass
+
+        self.assertIs(Meta.get_adapter(A), AdaptedA)
+        self.assertIs(Meta.get_adapter(B), AdaptedB)
+        self.assertIs(Meta.get_adapter(C), AdaptedB)
+        self.assertIs(Meta.get_adapter(AdaptedB), AdaptedB)
+        self.assertIsNone(Meta.get_adapter(int))
+
+    def test_adapter_lookup_02(self):
+        class A:
+            pass
+
+        class B(A):
+            pass
+
+        class Meta(adapter.Adapter):
+            pass
+
+        class AdaptedA(metaclass=Meta, adapts=A):
+            pass
+
+        # Populate the lookup cache.
+        self.assertIs(Meta.get_adapter(B), AdaptedA)
+
+        # A new registration must not be shadowed by a stale result.
+        class AdaptedB(AdaptedA, adapts=B):
+            pass
+
+        self.assertIs(Meta.get_adapter(B), AdaptedB)
@@ -952,6 +952,25 @@ class TestSchema(tb.BaseSchemaLoadTest):
             })
         )
 
+    def test_schema_drop_extending_01(self):
+        schema = self.load_schema("""
+            type A;
+            type B;
+            type C;
+            type X extending A, B, C;
+        """)
+
+        # Dropping two adjacent bases in one command must drop both.
+        schema = self.run_ddl(schema, '''
+            ALTER TYPE test::X DROP EXTENDING test::A, test::B;
+        ''')
+
+        X = schema.get('test::X')
+        self.assertEqual(
+            [str(n) for n in X.get_bases(schema).names(schema)],
+            ['test::C'],
+        )
+
     def test_schema_annotation_inheritance_01(self):
         schema = self.load_schema("""
             abstract annotation noninh;